@@ -2,92 +2,27 @@
 HTML Report Generator for Hardware Detection Results.
 Creates a modern, visually stunning dashboard-style report.
 """
+import html
+import io
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, BinaryIO, List, Tuple
 
-def generate_html_report(
-    system: str,
-    ram_gb: float,
-    device_type: str,
-    vram_gb: float,
-    max_params: int,
-    gpu_details: List[Dict] = None,
-    recommended_models: List[Tuple[str, str]] = None
-) -> str:
-    """
-    Generate a beautiful HTML report for hardware detection results.
-    
-    Args:
-        system: Operating system name
-        ram_gb: Total system RAM in GB
-        device_type: Device type ('cuda', 'mps', or 'cpu')
-        vram_gb: Available VRAM/memory for AI in GB
-        max_params: Maximum parameter count (in billions)
-        gpu_details: List of GPU information dicts (for CUDA)
-        recommended_models: List of (model_name, description) tuples
-    
-    Returns:
-        str: Complete HTML document as string
-    """
-    
-    # Determine backend display name and icon
-    backend_info = {
-        'cuda': ('NVIDIA CUDA', '🎮', '#76B900'),
-        'mps': ('Apple Metal (MPS)', '🍎', '#147EFB'),
-        'cpu': ('CPU Only', '💻', '#FF6B6B')
-    }
-    backend_name, backend_icon, backend_color = backend_info.get(
-        device_type, ('Unknown', '❓', '#888888')
-    )
-    
-    # Build GPU details HTML
-    gpu_html = ""
-    if gpu_details:
-        for gpu in gpu_details:
-            gpu_html += f"""
-            <div class="gpu-card">
-                <div class="gpu-icon">🎮</div>
-                <div class="gpu-info">
-                    <div class="gpu-name">{gpu['name']}</div>
-                    <div class="gpu-vram">{gpu['vram']:.2f} GB VRAM</div>
-                </div>
-            </div>
-            """
-    
-    # Build model recommendations HTML
-    models_html = ""
-    if recommended_models:
-        for model_name, description in recommended_models:
-            models_html += f"""
-            <div class="model-card">
-                <div class="model-icon">🤖</div>
-                <div class="model-info">
-                    <div class="model-name">{model_name}</div>
-                    <div class="model-desc">{description}</div>
-                </div>
-            </div>
-            """
-    
-    # Performance tier badge
-    if vram_gb >= 48:
-        tier = "Enterprise"
-        tier_color = "#9333EA"
-    elif vram_gb >= 24:
-        tier = "Professional"
-        tier_color = "#3B82F6"
-    elif vram_gb >= 16:
-        tier = "Advanced"
-        tier_color = "#10B981"
-    elif vram_gb >= 8:
-        tier = "Standard"
-        tier_color = "#F59E0B"
-    else:
-        tier = "Entry"
-        tier_color = "#EF4444"
-    
-    timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p")
-    
-    html_template = f"""<!DOCTYPE html>
+from tiers import select_tier
+
+if TYPE_CHECKING:
+    from ll_model_selection import GpuInfo
+
+# Backend display name, icon and accent colour per device type
+_BACKEND_INFO = {
+    'cuda': ('NVIDIA CUDA', '🎮', '#76B900'),
+    'mps': ('Apple Metal (MPS)', '🍎', '#147EFB'),
+    'cpu': ('CPU Only', '💻', '#FF6B6B')
+}
+_UNKNOWN_BACKEND = ('Unknown', '❓', '#888888')
+
+# Static document prefix: doctype, <head> metadata and the colour-independent
+# CSS rules. Built once at import time and reused verbatim on every render.
+_STATIC_CSS_PREFIX = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -95,46 +30,46 @@ def generate_html_report(
     <title>Hardware Analysis Report - LLM Model Selection</title>
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             padding: 2rem;
             color: #1a1a1a;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
-        }}
+        }
         
-        .header {{
+        .header {
             text-align: center;
             margin-bottom: 3rem;
             animation: fadeInDown 0.6s ease-out;
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             color: white;
             font-size: 3rem;
             font-weight: 800;
             margin-bottom: 0.5rem;
             text-shadow: 0 2px 20px rgba(0,0,0,0.2);
-        }}
+        }
         
-        .header .subtitle {{
+        .header .subtitle {
             color: rgba(255,255,255,0.9);
             font-size: 1.1rem;
             font-weight: 400;
-        }}
+        }
         
-        .report-card {{
+        .report-card {
             background: white;
             border-radius: 24px;
             padding: 2.5rem;
@@ -142,45 +77,49 @@ def generate_html_report(
             box-shadow: 0 20px 60px rgba(0,0,0,0.15);
             animation: fadeInUp 0.6s ease-out;
             transition: transform 0.3s ease, box-shadow 0.3s ease;
-        }}
+        }
         
-        .report-card:hover {{
+        .report-card:hover {
             transform: translateY(-4px);
             box-shadow: 0 25px 70px rgba(0,0,0,0.2);
-        }}
+        }
         
-        .card-header {{
+        .card-header {
             display: flex;
             align-items: center;
             justify-content: space-between;
             margin-bottom: 2rem;
             padding-bottom: 1.5rem;
             border-bottom: 2px solid #f0f0f0;
-        }}
+        }
         
-        .card-title {{
+        .card-title {
             font-size: 1.75rem;
             font-weight: 700;
             color: #1a1a1a;
             display: flex;
             align-items: center;
             gap: 0.75rem;
-        }}
+        }
         
-        .card-icon {{
+        .card-icon {
             font-size: 2rem;
-        }}
+        }
         
-        .badge {{
+        .badge {
             padding: 0.5rem 1.25rem;
             border-radius: 50px;
             font-weight: 600;
             font-size: 0.875rem;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
         
-        .tier-badge {{
+"""
+
+# CSS rules that depend on the tier and backend colours. The *_TMPL constants
+# are str.format templates (CSS braces doubled) rendered with format_map().
+_HEAD_TMPL = """        .tier-badge {{
             background: linear-gradient(135deg, {tier_color}, {tier_color}dd);
             color: white;
             box-shadow: 0 4px 15px {tier_color}40;
@@ -317,23 +256,26 @@ def generate_html_report(
             transform: translateX(4px);
         }}
         
-        .model-icon {{
+"""
+
+# Remaining static CSS, closing </head>.
+_STATIC_CSS = """        .model-icon {
             font-size: 2rem;
-        }}
+        }
         
-        .model-name {{
+        .model-name {
             font-weight: 700;
             color: #1a1a1a;
             font-size: 1.1rem;
             margin-bottom: 0.25rem;
-        }}
+        }
         
-        .model-desc {{
+        .model-desc {
             color: #6b7280;
             font-size: 0.9rem;
-        }}
+        }
         
-        .warning-box {{
+        .warning-box {
             background: linear-gradient(135deg, #FEF3C7, #FDE68A);
             border-left: 4px solid #F59E0B;
             padding: 1.25rem;
@@ -341,83 +283,100 @@ def generate_html_report(
             margin-top: 1.5rem;
             display: flex;
             gap: 1rem;
-        }}
+        }
         
-        .warning-icon {{
+        .warning-icon {
             font-size: 1.5rem;
-        }}
+        }
         
-        .warning-content {{
+        .warning-content {
             flex: 1;
-        }}
+        }
         
-        .warning-title {{
+        .warning-title {
             font-weight: 700;
             color: #92400E;
             margin-bottom: 0.5rem;
-        }}
+        }
         
-        .warning-text {{
+        .warning-text {
             color: #78350F;
             font-size: 0.95rem;
             line-height: 1.6;
-        }}
+        }
         
-        .footer {{
+        .footer {
             text-align: center;
             color: rgba(255,255,255,0.8);
             margin-top: 2rem;
             font-size: 0.9rem;
-        }}
+        }
         
-        .footer a {{
+        .footer a {
             color: white;
             text-decoration: none;
             font-weight: 600;
-        }}
+        }
         
-        @keyframes fadeInDown {{
-            from {{
+        @keyframes fadeInDown {
+            from {
                 opacity: 0;
                 transform: translateY(-20px);
-            }}
-            to {{
+            }
+            to {
                 opacity: 1;
                 transform: translateY(0);
-            }}
-        }}
+            }
+        }
         
-        @keyframes fadeInUp {{
-            from {{
+        @keyframes fadeInUp {
+            from {
                 opacity: 0;
                 transform: translateY(20px);
-            }}
-            to {{
+            }
+            to {
                 opacity: 1;
                 transform: translateY(0);
-            }}
-        }}
+            }
+        }
         
-        @media (max-width: 768px) {{
-            body {{
+        @media (max-width: 768px) {
+            body {
                 padding: 1rem;
-            }}
+            }
             
-            .header h1 {{
+            .header h1 {
                 font-size: 2rem;
-            }}
+            }
             
-            .report-card {{
+            .report-card {
                 padding: 1.5rem;
-            }}
+            }
             
-            .stats-grid {{
+            .stats-grid {
                 grid-template-columns: 1fr;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
-<body>
+"""
+
+# Optional notice shown only for CPU-only backends.
+_CPU_WARNING_HTML = """
+            <div class="warning-box">
+                <div class="warning-icon">⚠️</div>
+                <div class="warning-content">
+                    <div class="warning-title">CPU Performance Notice</div>
+                    <div class="warning-text">
+                        CPU inference will be significantly slower than GPU/MPS acceleration. 
+                        Consider using GGUF format models with llama.cpp for better CPU performance.
+                    </div>
+                </div>
+            </div>
+            """
+
+# System overview card; the GPU grid is streamed right after it.
+_OVERVIEW_TMPL = """<body>
     <div class="container">
         <div class="header">
             <h1>🚀 Hardware Analysis Report</h1>
@@ -461,7 +420,21 @@ def generate_html_report(
                 </div>
             </div>
             
-            {f'<div class="gpu-grid">{gpu_html}</div>' if gpu_html else ''}
+            """
+
+# One card per GPU in the system overview
+_GPU_CARD_TMPL = """
+            <div class="gpu-card">
+                <div class="gpu-icon">🎮</div>
+                <div class="gpu-info">
+                    <div class="gpu-name">{name}</div>
+                    <div class="gpu-vram">{vram} GB VRAM</div>
+                </div>
+            </div>
+            """
+
+# Static markup between the GPU grid and the model cards.
+_MODELS_HEADER_HTML = """
         </div>
         
         <!-- Model Recommendations Card -->
@@ -475,21 +448,24 @@ def generate_html_report(
             </div>
             
             <div class="models-grid">
-                {models_html}
-            </div>
-            
-            {'''
-            <div class="warning-box">
-                <div class="warning-icon">⚠️</div>
-                <div class="warning-content">
-                    <div class="warning-title">CPU Performance Notice</div>
-                    <div class="warning-text">
-                        CPU inference will be significantly slower than GPU/MPS acceleration. 
-                        Consider using GGUF format models with llama.cpp for better CPU performance.
-                    </div>
+                """
+
+# One card per recommended model
+_MODEL_CARD_TMPL = """
+            <div class="model-card">
+                <div class="model-icon">🤖</div>
+                <div class="model-info">
+                    <div class="model-name">{name}</div>
+                    <div class="model-desc">{desc}</div>
                 </div>
             </div>
-            ''' if device_type == 'cpu' else ''}
+            """
+
+# CPU notice, footer and document close.
+_FOOTER_TMPL = """
+            </div>
+            
+            {cpu_warning}
         </div>
         
         <div class="footer">
@@ -498,5 +474,126 @@ def generate_html_report(
     </div>
 </body>
 </html>"""
+
+# Static sections encoded once at import time, so rendering only pays the
+# UTF-8 encoding cost for the small templated sections.
+_STATIC_CSS_PREFIX_B = _STATIC_CSS_PREFIX.encode('utf-8')
+_STATIC_CSS_B = _STATIC_CSS.encode('utf-8')
+_MODELS_HEADER_B = _MODELS_HEADER_HTML.encode('utf-8')
+
+def generate_html_report(
+    out: BinaryIO,
+    system: str,
+    ram_gb: float,
+    device_type: str,
+    vram_gb: float,
+    max_params: int,
+    gpu_details: List['GpuInfo'] = None,
+    recommended_models: List[Tuple[str, str]] = None,
+    timestamp: str = None
+) -> None:
+    """
+    Write a beautiful HTML report for hardware detection results.
+    
+    The document is streamed to ``out`` as UTF-8, section by section, instead
+    of being assembled into one large string first. Static sections are
+    written from pre-encoded bytes; only the templated ones are encoded here.
+    
+    Args:
+        out: Binary stream the HTML document is written to
+        system: Operating system name
+        ram_gb: Total system RAM in GB
+        device_type: Device type ('cuda', 'mps', or 'cpu')
+        vram_gb: Available VRAM/memory for AI in GB
+        max_params: Maximum parameter count (in billions)
+        gpu_details: List of GpuInfo records (for CUDA)
+        recommended_models: List of (model_name, description) tuples
+        timestamp: Pre-formatted generation time; defaults to now. Pass one
+            value to share it across a batch of reports
+    """
+    
+    # Determine backend display name and icon
+    backend_name, backend_icon, backend_color = _BACKEND_INFO.get(
+        device_type, _UNKNOWN_BACKEND
+    )
+    
+    # Performance tier badge
+    tier, tier_color, _ = select_tier(vram_gb)
+    
+    if timestamp is None:
+        timestamp = f"{datetime.now():%B %d, %Y at %I:%M %p}"
+    
+    # Values shared by every templated section
+    ctx = {
+        'tier': tier,
+        'tier_color': tier_color,
+        'system': system,
+        'ram_gb': ram_gb,
+        'vram_gb': vram_gb,
+        'max_params': max_params,
+        'backend_icon': backend_icon,
+        'backend_name': backend_name,
+        'backend_color': backend_color,
+        'cpu_warning': _CPU_WARNING_HTML if device_type == 'cpu' else '',
+        'timestamp': timestamp,
+    }
+    
+    write = out.write
+    write(_STATIC_CSS_PREFIX_B)
+    write(_HEAD_TMPL.format_map(ctx).encode('utf-8'))
+    write(_STATIC_CSS_B)
+    write(_OVERVIEW_TMPL.format_map(ctx).encode('utf-8'))
     
-    return html_template
+    # Loop helpers bound to locals. GPU and model names come from the driver
+    # and caller, so they are escaped before being spliced in.
+    escape = html.escape
+    gpu_card = _GPU_CARD_TMPL.format
+    model_card = _MODEL_CARD_TMPL.format
+    
+    # GPU details
+    if gpu_details:
+        write(b'<div class="gpu-grid">')
+        for gpu in gpu_details:
+            write(gpu_card(name=escape(gpu.name), vram=gpu.vram_fmt).encode('utf-8'))
+        write(b'</div>')
+    
+    # Model recommendations
+    write(_MODELS_HEADER_B)
+    if recommended_models:
+        for model_name, description in recommended_models:
+            write(model_card(name=escape(model_name), desc=escape(description)).encode('utf-8'))
+    
+    write(_FOOTER_TMPL.format_map(ctx).encode('utf-8'))
+
+def generate_html_string(
+    system: str,
+    ram_gb: float,
+    device_type: str,
+    vram_gb: float,
+    max_params: int,
+    gpu_details: List['GpuInfo'] = None,
+    recommended_models: List[Tuple[str, str]] = None,
+    timestamp: str = None
+) -> str:
+    """
+    Generate the HTML report as a single string.
+    
+    Thin wrapper around generate_html_report() for callers that need the
+    whole document in memory.
+    
+    Returns:
+        str: Complete HTML document as string
+    """
+    buffer = io.BytesIO()
+    generate_html_report(
+        buffer,
+        system=system,
+        ram_gb=ram_gb,
+        device_type=device_type,
+        vram_gb=vram_gb,
+        max_params=max_params,
+        gpu_details=gpu_details,
+        recommended_models=recommended_models,
+        timestamp=timestamp
+    )
+    return buffer.getvalue().decode('utf-8')
@@ -31,27 +31,37 @@ v1.0 (2026-01-21) - Initial release
     - Model recommendations based on VRAM
     - HTML report generation
 """
+import os
+import sys
 import torch
 import psutil
 import platform
-import webbrowser
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Tuple, List, Dict
-from html_report import generate_html_report
+from typing import Tuple, List
+from tiers import select_tier
 
 # Constants for memory calculations
+BYTES_PER_GB = 1024 ** 3         # Bytes per GB (binary, GiB)
 MPS_USABLE_MEMORY_RATIO = 0.75  # Conservative estimate for macOS unified memory
 CPU_USABLE_MEMORY_RATIO = 0.5   # Half of RAM for CPU inference
 CONTEXT_OVERHEAD_GB = 2.0        # Memory overhead for context/KV cache
 QUANT_4BIT_GB_PER_BILLION = 0.75 # VRAM per billion parameters (4-bit quantization)
 
-# VRAM Tiers
-VRAM_TIER_ENTERPRISE = 48.0
-VRAM_TIER_PROFESSIONAL = 24.0
-VRAM_TIER_ADVANCED = 16.0
-VRAM_TIER_STANDARD = 8.0
+# Report output
+REPORT_FILE_MODE = 0o644
+REPORT_WRITE_BUFFER = 64 * 1024  # Holds a whole report so it reaches disk in one write
 
-def get_hardware_capacity() -> Tuple[float, str, float, str, List[Dict]]:
+@dataclass
+class GpuInfo:
+    """Name and memory of a single CUDA device."""
+    __slots__ = ('name', 'vram', 'vram_fmt')
+    
+    name: str
+    vram: float     # VRAM in GB
+    vram_fmt: str   # VRAM formatted for display, e.g. "24.00"
+
+def get_hardware_capacity() -> Tuple[float, str, float, str, List[GpuInfo]]:
     """
     Detect available hardware and estimate usable VRAM/memory for LLM inference.
     
@@ -61,36 +71,35 @@ def get_hardware_capacity() -> Tuple[float, str, float, str, List[Dict]]:
         - device_type (str): 'cuda'/'mps'/'cpu'
         - ram_gb (float): Total system RAM in GB
         - system (str): Operating system name
-        - gpu_details (List[Dict]): GPU information (for CUDA)
+        - gpu_details (List[GpuInfo]): GPU information (for CUDA)
     """
     system = platform.system()
     device_type = "cpu"
     vram_gb = 0.0
-    ram_gb = psutil.virtual_memory().total / (1024 ** 3)
+    ram_gb = psutil.virtual_memory().total / BYTES_PER_GB
 
     gpu_details = []
+    lines = []  # Console report, written in one go at the end
     
-    print(f"### Hardware Audit: {system} ###")
-    print(f"* System RAM: {ram_gb:.2f} GB")
+    lines.append(f"### Hardware Audit: {system} ###")
+    lines.append(f"* System RAM: {ram_gb:.2f} GB")
     
     # 1. Check NVIDIA GPU (Windows/Linux)
     try:
         if torch.cuda.is_available():
             device_type = "cuda"
             gpu_count = torch.cuda.device_count()
-            print(f"* Backend: NVIDIA CUDA ({gpu_count} devices)")
-            for i in range(gpu_count):
-                props = torch.cuda.get_device_properties(i)
-                v_mem = props.total_memory / (1024 ** 3)
-                print(f"  - GPU {i}: {props.name} | {v_mem:.2f} GB VRAM")
-                gpu_details.append({'name': props.name, 'vram': v_mem})
-                vram_gb += v_mem
+            lines.append(f"* Backend: NVIDIA CUDA ({gpu_count} devices)")
+            props_list = [torch.cuda.get_device_properties(i) for i in range(gpu_count)]
+            # Sum exact byte counts first, then convert once
+            vram_gb = sum(p.total_memory for p in props_list) / BYTES_PER_GB
+            for i, props in enumerate(props_list):
+                v_mem = props.total_memory / BYTES_PER_GB
+                v_mem_fmt = f"{v_mem:.2f}"
+                lines.append(f"  - GPU {i}: {props.name} | {v_mem_fmt} GB VRAM")
+                gpu_details.append(GpuInfo(props.name, v_mem, v_mem_fmt))
     except (RuntimeError, AttributeError) as e:
-        print(f"  Warning: CUDA detection failed: {e}")
-    except ImportError:
-        print("  Warning: CUDA not available (PyTorch built without CUDA support)")
-    except Exception as e:
-        print(f"  Warning: Unexpected error during CUDA detection: {e}")
+        lines.append(f"  Warning: CUDA detection failed: {e}")
             
     # 2. Check Apple Silicon (Mac)
     if vram_gb == 0:  # Only check if CUDA wasn't found
@@ -100,23 +109,22 @@ def get_hardware_capacity() -> Tuple[float, str, float, str, List[Dict]]:
                 # On Mac, VRAM is effectively Unified Memory (System RAM)
                 # MacOS usually reserves ~20-30% for OS, so we use conservative estimate
                 vram_gb = ram_gb * MPS_USABLE_MEMORY_RATIO
-                print(f"* Backend: Apple Metal Performance Shaders (MPS)")
-                print(f"* Unified Memory: {ram_gb:.2f} GB (Est. Usable for AI: {vram_gb:.2f} GB)")
+                lines.append(f"* Backend: Apple Metal Performance Shaders (MPS)")
+                lines.append(f"* Unified Memory: {ram_gb:.2f} GB (Est. Usable for AI: {vram_gb:.2f} GB)")
         except (RuntimeError, AttributeError) as e:
-            print(f"  Warning: MPS detection failed: {e}")
-        except Exception as e:
-            print(f"  Warning: Unexpected error during MPS detection: {e}")
+            lines.append(f"  Warning: MPS detection failed: {e}")
         
     # 3. Fallback to CPU
     if vram_gb == 0:
         device_type = "cpu"
         vram_gb = ram_gb * CPU_USABLE_MEMORY_RATIO
-        print("* Backend: CPU Only (Not recommended for large models)")
-        print(f"* Estimated Usable Memory: {vram_gb:.2f} GB")
-        
+        lines.append("* Backend: CPU Only (Not recommended for large models)")
+        lines.append(f"* Estimated Usable Memory: {vram_gb:.2f} GB")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     return vram_gb, device_type, ram_gb, system, gpu_details
 
-def recommend_models(vram_gb: float, device_type: str) -> Tuple[int, List[Tuple[str, str]]]:
+def recommend_models(vram_gb: float, device_type: str) -> Tuple[int, Tuple[Tuple[str, str], ...]]:
     """
     Recommend LLM models based on available VRAM/memory.
     
@@ -127,8 +135,11 @@ def recommend_models(vram_gb: float, device_type: str) -> Tuple[int, List[Tuple[
     Returns:
         Tuple containing:
         - max_params (int): Maximum parameter count in billions
-        - models (List[Tuple[str, str]]): List of (model_name, description) tuples
+        - models (Tuple[Tuple[str, str], ...]): Shared, read-only (model_name,
+          description) pairs for the matching tier
     """
+    lines = []  # Console report, written in one go at the end
+    
     # Rule of Thumb (4-bit quant): ~0.7-0.8 GB VRAM per 1 Billion Parameters + Context overhead
     # Formula: Max_Params = (VRAM - Context_Overhead) / GB_per_Billion
     
@@ -140,52 +151,20 @@ def recommend_models(vram_gb: float, device_type: str) -> Tuple[int, List[Tuple[
     if max_params < 2: 
         max_params = 2
 
-    print(f"\n### Feasible Local Deployment (4-bit Quantization) ###")
-    print(f"* Effective VRAM Cap: {vram_gb:.2f} GB")
-    print(f"* Theoretical Max Parameter Count: ~{int(max_params)}B")
-    
-    models = []
-    print("\nRecommended Models (4-bit Quantization):")
-    if vram_gb >= VRAM_TIER_ENTERPRISE:
-        models = [
-            ("Llama-3.1-70B / Llama-3.3-70B", "High performance flagship models"),
-            ("Qwen2.5-72B", "Excellent reasoning and multilingual capabilities"),
-            ("Mixtral 8x7B", "Mixture of Experts architecture for efficiency")
-        ]
-    elif vram_gb >= VRAM_TIER_PROFESSIONAL:
-        models = [
-            ("Llama-3.1-70B", "Heavily quantized, may be slower but very capable"),
-            ("Mixtral 8x7B", "Comfortable fit with good performance"),
-            ("Command R (35B)", "Optimized for RAG and tool use"),
-            ("Qwen2.5-32B", "Strong reasoning with multilingual support")
-        ]
-    elif vram_gb >= VRAM_TIER_ADVANCED:
-        models = [
-            ("Llama-3.1-13B / Llama-2-13B", "Balanced performance and efficiency"),
-            ("Mistral-7B", "Quantized with plenty of headroom"),
-            ("Qwen2.5-14B", "Strong performance in this tier")
-        ]
-    elif vram_gb >= VRAM_TIER_STANDARD:
-        models = [
-            ("Llama-3.1-8B", "Gold standard for consumer hardware"),
-            ("Mistral-7B", "Excellent general-purpose model"),
-            ("Gemma-7B", "Google's efficient open model"),
-            ("Qwen2.5-7B", "Strong multilingual capabilities")
-        ]
-    else:
-        models = [
-            ("Phi-3-mini (3.8B)", "Highly capable for its size"),
-            ("Gemma-2B", "Efficient small model"),
-            ("TinyLlama (1.1B)", "Minimal resource requirements")
-        ]
+    lines.append(f"\n### Feasible Local Deployment (4-bit Quantization) ###")
+    lines.append(f"* Effective VRAM Cap: {vram_gb:.2f} GB")
+    lines.append(f"* Theoretical Max Parameter Count: ~{int(max_params)}B")
     
+    lines.append("\nRecommended Models (4-bit Quantization):")
+    _, _, models = select_tier(vram_gb)
     for model_name, description in models:
-        print(f"- {model_name}: {description}")
+        lines.append(f"- {model_name}: {description}")
     
     if device_type == "cpu":
-        print("\n⚠️  Note: CPU inference will be significantly slower than GPU/MPS.")
-        print("   Consider using GGUF format models with llama.cpp for better CPU performance.")
+        lines.append("\n⚠️  Note: CPU inference will be significantly slower than GPU/MPS.")
+        lines.append("   Consider using GGUF format models with llama.cpp for better CPU performance.")
     
+    sys.stdout.write("\n".join(lines) + "\n")
     return int(max_params), models
 
 def main(output_path: str = "hardware_report.html"):
@@ -194,37 +173,44 @@ def main(output_path: str = "hardware_report.html"):
     
     Args:
         output_path (str): Path to save the HTML report.
+    
+    Set the NO_BROWSER environment variable to skip opening the report.
     """
+    # Imported here so programmatic users of the detection helpers don't pay for them
+    from html_report import generate_html_report
+    
     # Get hardware information
     vram_gb, device_type, ram_gb, system, gpu_details = get_hardware_capacity()
     
     # Get model recommendations
     max_params, models = recommend_models(vram_gb, device_type)
     
-    # Generate HTML report
-    html_content = generate_html_report(
-        system=system,
-        ram_gb=ram_gb,
-        device_type=device_type,
-        vram_gb=vram_gb,
-        max_params=max_params,
-        gpu_details=gpu_details if gpu_details else None,
-        recommended_models=models
-    )
-    
-    # Save report to file
+    # Generate HTML report, streaming UTF-8 straight to the output file
     out_file = Path(output_path)
     try:
-        out_file.write_text(html_content, encoding='utf-8')
-        print(f"\n✅ HTML report generated: {out_file.absolute()}")
+        fd = os.open(out_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, REPORT_FILE_MODE)
+        with open(fd, "wb", buffering=REPORT_WRITE_BUFFER) as f:
+            generate_html_report(
+                f,
+                system=system,
+                ram_gb=ram_gb,
+                device_type=device_type,
+                vram_gb=vram_gb,
+                max_params=max_params,
+                gpu_details=gpu_details if gpu_details else None,
+                recommended_models=models
+            )
+    except OSError as e:
+        print(f"\n❌ Error saving report: {e}")
+        return
+    
+    print(f"\n✅ HTML report generated: {out_file.absolute()}")
+    
+    # Open in default browser
+    if not os.environ.get("NO_BROWSER"):
+        import webbrowser
         print("   Opening in browser...")
-        
-        # Open in default browser
         webbrowser.open(f"file://{out_file.absolute()}")
-    except IOError as e:
-        print(f"\n❌ Error saving report: {e}")
-    except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+VRAM Performance Tiers
+======================
+Single source of truth for the VRAM tier thresholds shared by the console
+model recommendations and the HTML report badge.
+"""
+import bisect
+from typing import Tuple
+
+# VRAM Tiers
+VRAM_TIER_ENTERPRISE = 48.0
+VRAM_TIER_PROFESSIONAL = 24.0
+VRAM_TIER_ADVANCED = 16.0
+VRAM_TIER_STANDARD = 8.0
+
+# Recommended models per tier as (model_name, description) pairs
+_MODELS_ENTERPRISE = (
+    ("Llama-3.1-70B / Llama-3.3-70B", "High performance flagship models"),
+    ("Qwen2.5-72B", "Excellent reasoning and multilingual capabilities"),
+    ("Mixtral 8x7B", "Mixture of Experts architecture for efficiency")
+)
+_MODELS_PROFESSIONAL = (
+    ("Llama-3.1-70B", "Heavily quantized, may be slower but very capable"),
+    ("Mixtral 8x7B", "Comfortable fit with good performance"),
+    ("Command R (35B)", "Optimized for RAG and tool use"),
+    ("Qwen2.5-32B", "Strong reasoning with multilingual support")
+)
+_MODELS_ADVANCED = (
+    ("Llama-3.1-13B / Llama-2-13B", "Balanced performance and efficiency"),
+    ("Mistral-7B", "Quantized with plenty of headroom"),
+    ("Qwen2.5-14B", "Strong performance in this tier")
+)
+_MODELS_STANDARD = (
+    ("Llama-3.1-8B", "Gold standard for consumer hardware"),
+    ("Mistral-7B", "Excellent general-purpose model"),
+    ("Gemma-7B", "Google's efficient open model"),
+    ("Qwen2.5-7B", "Strong multilingual capabilities")
+)
+_MODELS_ENTRY = (
+    ("Phi-3-mini (3.8B)", "Highly capable for its size"),
+    ("Gemma-2B", "Efficient small model"),
+    ("TinyLlama (1.1B)", "Minimal resource requirements")
+)
+
+# Lower VRAM bound (GB) of every tier above Entry, ascending
+_BREAKS = (VRAM_TIER_STANDARD, VRAM_TIER_ADVANCED, VRAM_TIER_PROFESSIONAL, VRAM_TIER_ENTERPRISE)
+
+# (name, badge colour, models) per tier; index i covers VRAM in [_BREAKS[i-1], _BREAKS[i])
+_TIERS = (
+    ("Entry", "#EF4444", _MODELS_ENTRY),
+    ("Standard", "#F59E0B", _MODELS_STANDARD),
+    ("Advanced", "#10B981", _MODELS_ADVANCED),
+    ("Professional", "#3B82F6", _MODELS_PROFESSIONAL),
+    ("Enterprise", "#9333EA", _MODELS_ENTERPRISE),
+)
+
+def select_tier(vram_gb: float) -> Tuple[str, str, Tuple[Tuple[str, str], ...]]:
+    """
+    Look up the performance tier for the given VRAM/memory capacity.
+    
+    Args:
+        vram_gb: Available VRAM in GB
+    
+    Returns:
+        Tuple containing:
+        - name (str): Tier name, e.g. 'Professional'
+        - color (str): Badge colour as a hex string
+        - models (Tuple[Tuple[str, str], ...]): Shared, read-only
+          (model_name, description) pairs recommended for the tier
+    """
+    return _TIERS[bisect.bisect_right(_BREAKS, vram_gb)]